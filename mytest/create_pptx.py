@@ -4,21 +4,38 @@
 """
 演示使用python-pptx创建PowerPoint演示文稿
 包含：标题页、文本、图片、形状、表格和图表
+
+除 python-pptx 本身的依赖外，内存图片幻灯片还需要 NumPy（pip install numpy）
 """
 
 import os
 import io
-from datetime import datetime
-from PIL import Image, ImageDraw
-from typing import TYPE_CHECKING, Any
+import struct
+import sys
+import zipfile
+import zlib
+from concurrent.futures import ProcessPoolExecutor
+from functools import lru_cache
+from xml.sax.saxutils import escape
+from datetime import date
+from typing import TYPE_CHECKING, Callable, Dict, Optional, Tuple
+
+from lxml import etree
 
+import pptx
 from pptx import Presentation
-from pptx.util import Inches, Pt
+from pptx.slide import Slide, SlideLayout
+from pptx.util import Inches, Length, Pt
 from pptx.enum.text import PP_ALIGN
 from pptx.dml.color import RGBColor
 from pptx.enum.shapes import MSO_SHAPE
-from pptx.chart.data import CategoryChartData
-from pptx.enum.chart import XL_CHART_TYPE
+from pptx.oxml import parse_xml
+from pptx.opc.constants import CONTENT_TYPE as CT
+from pptx.opc.constants import RELATIONSHIP_TYPE as RT
+from pptx.opc.oxml import serialize_part_xml
+from pptx.opc.packuri import CONTENT_TYPES_URI, PACKAGE_URI
+from pptx.opc.serialized import _ContentTypesItem  # pyright: ignore[reportPrivateUsage]
+from pptx.oxml.ns import namespaces, nsdecls, qn
 
 # Type aliases for type checking
 if TYPE_CHECKING:
@@ -26,180 +43,471 @@ if TYPE_CHECKING:
 else:
     PresentationType = Presentation
 
+# 默认模板中用到的版式序号
+_TITLE_LAYOUT = 0  # 标题布局
+_BULLET_LAYOUT = 1  # 带项目符号的布局
+_TITLE_ONLY_LAYOUT = 5  # 仅标题布局
+
+# 标题页副标题，日期在模块加载时确定一次
+_TODAY = date.today().isoformat()
+_SUBTITLE = f"创建于 {_TODAY}\npython-pptx 示例"
+
+# 保存 .pptx 时的文件写缓冲大小
+_SAVE_BUFFER_SIZE = 1 << 20
+
+# 常用尺寸预先换算为 EMU，避免每次调用都构造 Length 对象
+_IN = {k: Inches(k) for k in (1, 1.5, 2, 2.5, 4, 5, 5.5, 6, 7, 8)}
+_PT = {k: Pt(k) for k in (14, 16, 20)}
+
+# 本身已经压缩过的部件，保存时直接存储，不再 DEFLATE 一遍
+_STORED_CONTENT_TYPES = frozenset((CT.GIF, CT.JPEG, CT.PNG, CT.SML_SHEET))
+
+# 演示图片中的矩形条带 (y0, y1, x0, x1, r, g, b)，按绘制顺序排列
+_DEMO_RECTS = (
+    # 蓝色边框，相当于 rectangle([(20, 20), (480, 280)], outline='blue', width=5)
+    (20, 25, 20, 481, 0, 0, 255),
+    (276, 281, 20, 481, 0, 0, 255),
+    (20, 281, 20, 25, 0, 0, 255),
+    (20, 281, 476, 481, 0, 0, 255),
+    # 浅蓝填充、深蓝边框的矩形，相当于 rectangle([(100, 100), (400, 200)], width=2)
+    (100, 201, 100, 401, 173, 216, 230),
+    (100, 102, 100, 401, 0, 0, 139),
+    (199, 201, 100, 401, 0, 0, 139),
+    (100, 201, 100, 102, 0, 0, 139),
+    (100, 201, 399, 401, 0, 0, 139),
+)
+
+# 图表幻灯片的数据：簇状柱形图，分类在工作表 A 列，各系列依次占用 B、C 列
+_CHART_TITLE = "季度销售额对比"
+_CHART_CATEGORIES = ('一季度', '二季度', '三季度', '四季度')
+_CHART_SERIES = (
+    ('2024年', (8.5, 10.2, 12.5, 9.8)),
+    ('2025年', (10.2, 11.5, 13.8, 11.2)),
+)
+
+# 与 add_chart(XL_CHART_TYPE.COLUMN_CLUSTERED, ...) 加上图表标题后生成的 XML 一致
+_CHART_XML_TEMPLATE = (
+    '<c:chartSpace %s>'
+    '<c:date1904 val="0"/>'
+    '<c:chart>'
+    '<c:title><c:tx><c:rich><a:bodyPr/><a:lstStyle/>'
+    '<a:p><a:r><a:t>{title}</a:t></a:r></a:p>'
+    '</c:rich></c:tx><c:layout/><c:overlay val="0"/></c:title>'
+    '<c:autoTitleDeleted val="0"/>'
+    '<c:plotArea>'
+    '<c:barChart>'
+    '<c:barDir val="col"/>'
+    '<c:grouping val="clustered"/>'
+    '{sers}'
+    '<c:axId val="-2068027336"/>'
+    '<c:axId val="-2113994440"/>'
+    '</c:barChart>'
+    '<c:catAx>'
+    '<c:axId val="-2068027336"/>'
+    '<c:scaling><c:orientation val="minMax"/></c:scaling>'
+    '<c:delete val="0"/>'
+    '<c:axPos val="b"/>'
+    '<c:majorTickMark val="out"/>'
+    '<c:minorTickMark val="none"/>'
+    '<c:tickLblPos val="nextTo"/>'
+    '<c:crossAx val="-2113994440"/>'
+    '<c:crosses val="autoZero"/>'
+    '<c:auto val="1"/>'
+    '<c:lblAlgn val="ctr"/>'
+    '<c:lblOffset val="100"/>'
+    '<c:noMultiLvlLbl val="0"/>'
+    '</c:catAx>'
+    '<c:valAx>'
+    '<c:axId val="-2113994440"/>'
+    '<c:scaling/>'
+    '<c:delete val="0"/>'
+    '<c:axPos val="l"/>'
+    '<c:majorGridlines/>'
+    '<c:majorTickMark val="out"/>'
+    '<c:minorTickMark val="none"/>'
+    '<c:tickLblPos val="nextTo"/>'
+    '<c:crossAx val="-2068027336"/>'
+    '<c:crosses val="autoZero"/>'
+    '</c:valAx>'
+    '</c:plotArea>'
+    '<c:dispBlanksAs val="gap"/>'
+    '</c:chart>'
+    '<c:txPr><a:bodyPr/><a:lstStyle/>'
+    '<a:p><a:pPr><a:defRPr sz="1800"/></a:pPr><a:endParaRPr lang="en-US"/></a:p>'
+    '</c:txPr>'
+    '</c:chartSpace>'
+) % nsdecls("c", "a", "r")
+
+_CHART_SER_TEMPLATE = (
+    '<c:ser>'
+    '<c:idx val="{idx}"/>'
+    '<c:order val="{idx}"/>'
+    '<c:tx><c:strRef><c:f>Sheet1!${col}$1</c:f>'
+    '<c:strCache><c:ptCount val="1"/><c:pt idx="0"><c:v>{name}</c:v></c:pt></c:strCache>'
+    '</c:strRef></c:tx>'
+    '<c:cat><c:strRef><c:f>Sheet1!$A$2:$A${last_row}</c:f>'
+    '<c:strCache><c:ptCount val="{count}"/>{cat}</c:strCache>'
+    '</c:strRef></c:cat>'
+    '<c:val><c:numRef><c:f>Sheet1!${col}$2:${col}${last_row}</c:f>'
+    '<c:numCache><c:formatCode>General</c:formatCode><c:ptCount val="{count}"/>{val}</c:numCache>'
+    '</c:numRef></c:val>'
+    '</c:ser>'
+)
+
+# 形状幻灯片中的形状：(类型, 左, 上, 宽, 高（英寸）, 填充色, 是否去掉阴影)
+_SHAPES = (
+    (MSO_SHAPE.RECTANGLE, 1, 2, 2, 1, RGBColor(255, 0, 0), True),  # 红色矩形
+    (MSO_SHAPE.OVAL, 4, 2, 2, 1, RGBColor(0, 255, 0), False),  # 绿色椭圆
+    # (MSO_SHAPE.TRIANGLE, 7, 2, 2, 1, RGBColor(0, 0, 255), False),  # 蓝色三角形
+    (MSO_SHAPE.STAR_5_POINT, 2.5, 4, 2, 2, RGBColor(255, 255, 0), False),  # 黄色五角星
+    (MSO_SHAPE.HEART, 5.5, 4, 2, 2, RGBColor(255, 0, 255), False),  # 紫色心形
+)
+
+# 表格单元格写入用到的 XPath 和标签名，只编译/换算一次
+_TC_T_XPATH = etree.XPath("./a:txBody/a:p/a:r/a:t", namespaces=namespaces("a"))
+_TC_P_XPATH = etree.XPath("./a:txBody/a:p", namespaces=namespaces("a"))
+_A_R, _A_T, _A_RPR = qn("a:r"), qn("a:t"), qn("a:rPr")
 
-def main():
+# 内容幻灯片的二级项目符号
+_CONTENT_BULLETS = (
+    "创建新的 PowerPoint 演示文稿",
+    "添加和格式化文本内容",
+    "添加各种形状和图表",
+    "添加表格和图片",
+    "读取和修改现有的演示文稿",
+)
+
+# 预先拼好的项目符号段落 XML，外层 <a:txBody> 仅作为解析容器
+_CONTENT_BULLETS_XML = "<a:txBody %s>%s</a:txBody>" % (
+    nsdecls("a"),
+    "".join(
+        '<a:p><a:pPr lvl="1"/><a:r><a:t>%s</a:t></a:r></a:p>' % escape(text)
+        for text in _CONTENT_BULLETS
+    ),
+)
+
+
+@lru_cache(maxsize=1)
+def _default_template_blob() -> bytes:
+    """python-pptx 内置默认模板 default.pptx 的内容，每个进程只读取一次"""
+    template_path = os.path.join(os.path.dirname(pptx.__file__), 'templates', 'default.pptx')
+    with open(template_path, 'rb') as f:
+        return f.read()
+
+
+def new_presentation() -> PresentationType:
+    """与 Presentation() 相同，但从内存中的默认模板创建，不再每次读磁盘"""
+    return Presentation(io.BytesIO(_default_template_blob()))
+
+
+def main(parallel: bool = False):
+    """生成示例演示文稿
+
+    `parallel` 为 True 时，可独立构建的页面交给进程池构建；单个演示文稿时进程池的启动开销
+    大于收益，只适合批量生成的场景，因此默认按顺序构建。
+    """
     # 创建演示文稿对象
-    prs: PresentationType = Presentation()
-    
-    # 添加标题幻灯片
-    create_title_slide(prs)
-    
-    # 添加内容幻灯片
-    create_content_slide(prs)
-    
-    # 添加形状幻灯片
-    create_shapes_slide(prs)
-    
-    # 添加表格幻灯片
-    create_table_slide(prs)
-    
-    # 添加图表幻灯片
-    create_chart_slide(prs)
-    
-    # 添加图片幻灯片（注释掉，因为需要有图片文件）
-    create_image_slide(prs)
+    prs: PresentationType = new_presentation()
+    
+    # 版式只查找一次，各辅助函数共用
+    slide_layouts = prs.slide_layouts
+    layouts = {
+        idx: slide_layouts[idx] for idx in (_TITLE_LAYOUT, _BULLET_LAYOUT, _TITLE_ONLY_LAYOUT)
+    }
+    
+    # 按页面顺序排列：(辅助函数, 版式序号, 是否可在子进程中独立构建)
+    # 图表和内存图片页会创建关联的部件（图表、嵌入工作簿、图片），只能在主进程中构建
+    builders = (
+        (create_title_slide, _TITLE_LAYOUT, True),  # 标题幻灯片
+        (create_content_slide, _BULLET_LAYOUT, True),  # 内容幻灯片
+        (create_shapes_slide, _TITLE_ONLY_LAYOUT, True),  # 形状幻灯片
+        (create_table_slide, _TITLE_ONLY_LAYOUT, True),  # 表格幻灯片
+        (create_chart_slide, _TITLE_ONLY_LAYOUT, False),  # 图表幻灯片
+        (create_image_slide, _TITLE_ONLY_LAYOUT, True),  # 图片幻灯片
+        (create_image_slide_v2, _TITLE_ONLY_LAYOUT, False),  # 内存图片幻灯片
+    )
     
-    # 添加内存图片幻灯片
-    create_image_slide_v2(prs)
+    if parallel:
+        _build_slides_parallel(prs, layouts, builders)
+    else:
+        for builder, layout_idx, _ in builders:
+            builder(prs, layouts[layout_idx])
     
     # 保存演示文稿
     output_file = os.path.join(os.path.dirname(__file__), 'sample_presentation.pptx')
-    prs.save(output_file)
+    _fast_save(prs, output_file)
     
     print(f"演示文稿已保存为: {output_file}")
 
 
-def create_title_slide(prs: PresentationType):
+def _build_slides_parallel(
+    prs: PresentationType,
+    layouts: Dict[int, SlideLayout],
+    builders: Tuple[Tuple[Callable[[PresentationType, SlideLayout], None], int, bool], ...],
+):
+    """可独立构建的页面先提交给进程池，主进程同时按顺序构建其余页面并合并结果"""
+    standalone_count = sum(1 for _, _, standalone in builders if standalone)
+    with ProcessPoolExecutor(max_workers=min(standalone_count, os.cpu_count() or 1)) as executor:
+        futures = [
+            executor.submit(_render_slide_xml, builder, layout_idx) if standalone else None
+            for builder, layout_idx, standalone in builders
+        ]
+        for (builder, layout_idx, _), future in zip(builders, futures):
+            layout = layouts[layout_idx]
+            if future is None:
+                builder(prs, layout)
+            else:
+                _graft_slide(prs, layout, *future.result())
+
+
+def _render_slide_xml(
+    builder: Callable[[PresentationType, SlideLayout], None], layout_idx: int
+) -> Tuple[bytes, Tuple[str, ...]]:
+    """在子进程中用独立的演示文稿构建单页
+
+    返回该页 <p:spTree> 的 XML，以及该页全部关系的类型，供合并时检查。
+    """
+    prs = new_presentation()
+    builder(prs, prs.slide_layouts[layout_idx])
+    slide = prs.slides[0]
+    reltypes = tuple(rel.reltype for rel in slide.part.rels.values())
+    return etree.tostring(slide.shapes._spTree), reltypes  # pyright: ignore[reportPrivateUsage]
+
+
+def _graft_slide(
+    prs: PresentationType, layout: SlideLayout, sptree_xml: bytes, reltypes: Tuple[str, ...]
+):
+    """用 `layout` 新建一页，并以子进程返回的形状树替换其内容"""
+    # 只复制了形状树，页面的关系没有带过来；除版式外的关系（图片、超链接等）的 rId 会失效
+    if any(reltype != RT.SLIDE_LAYOUT for reltype in reltypes):
+        raise ValueError(
+            "slide built in worker has relationships other than its layout: %s" % (reltypes,)
+        )
+    slide = prs.slides.add_slide(layout)
+    spTree = slide.shapes._spTree  # pyright: ignore[reportPrivateUsage]
+    for child in list(spTree):
+        spTree.remove(child)
+    spTree.extend(list(parse_xml(sptree_xml)))
+
+
+def _set_title(slide: Slide, text: str):
+    """填写“仅标题”版式自带的标题占位符"""
+    title = slide.shapes.title
+    if title is not None:
+        title.text = text
+
+
+def _fast_set_cell(tc, text: str, bold: bool = False, size: Optional[Length] = None):
+    """直接写入单元格的 <a:r>/<a:t>，跳过 cell.text 的清空与重建
+
+    只覆盖单元格中第一个 <a:r>/<a:t> 的文字，其余 run 和段落保持不变；
+    与 cell.text 不同，它不会替换整个单元格的文本，适用于新建表格的空单元格。
+    """
+    t_lst = _TC_T_XPATH(tc)
+    if t_lst:
+        t = t_lst[0]
+        r = t.getparent()
+    else:
+        # 新建表格的单元格只有空的 <a:p/>，补一个 run
+        p = _TC_P_XPATH(tc)[0]
+        r = etree.SubElement(p, _A_R)
+        t = etree.SubElement(r, _A_T)
+    t.text = text
+    
+    if bold or size is not None:
+        rPr = r.find(_A_RPR)
+        if rPr is None:
+            rPr = etree.Element(_A_RPR)
+            r.insert(0, rPr)
+        if bold:
+            rPr.set("b", "1")
+        if size is not None:
+            rPr.set("sz", str(size.centipoints))
+
+
+def _chart_pts(values) -> str:
+    """把一组取值格式化为 <c:pt> 序列"""
+    return "".join(
+        '<c:pt idx="%d"><c:v>%s</c:v></c:pt>' % (idx, escape(str(value)))
+        for idx, value in enumerate(values)
+    )
+
+
+@lru_cache(maxsize=1)
+def _chart_xml() -> bytes:
+    """图表部件的 XML，每个进程只格式化一次"""
+    count = len(_CHART_CATEGORIES)
+    cat = _chart_pts(_CHART_CATEGORIES)
+    sers = "".join(
+        _CHART_SER_TEMPLATE.format(
+            idx=idx,
+            col=chr(ord('B') + idx),
+            name=escape(name),
+            last_row=count + 1,
+            count=count,
+            cat=cat,
+            val=_chart_pts(values),
+        )
+        for idx, (name, values) in enumerate(_CHART_SERIES)
+    )
+    return _CHART_XML_TEMPLATE.format(title=escape(_CHART_TITLE), sers=sers).encode('utf-8')
+
+
+@lru_cache(maxsize=1)
+def _chart_xlsx_blob() -> bytes:
+    """图表嵌入的 Excel 工作簿，布局与 _CHART_SER_TEMPLATE 中的单元格引用对应"""
+    from xlsxwriter import Workbook
+    
+    xlsx_file = io.BytesIO()
+    workbook = Workbook(xlsx_file, {'in_memory': True})
+    worksheet = workbook.add_worksheet()
+    worksheet.set_column(0, 0, 10)
+    worksheet.write_column(1, 0, _CHART_CATEGORIES)
+    for idx, (name, values) in enumerate(_CHART_SERIES):
+        worksheet.write(0, idx + 1, name)
+        worksheet.write_column(1, idx + 1, values)
+    workbook.close()
+    return xlsx_file.getvalue()
+
+
+def _render_demo(arr):
+    """在 300x500 的 RGB 缓冲区上绘制演示图片的白色背景和矩形"""
+    arr[:] = 255
+    for y0, y1, x0, x1, r, g, b in _DEMO_RECTS:
+        arr[y0:y1, x0:x1] = (r, g, b)
+
+
+def _png_chunk(chunk_type: bytes, data: bytes) -> bytes:
+    """组装一个 PNG 数据块：长度、类型、数据和 CRC32"""
+    return (
+        struct.pack('>I', len(data))
+        + chunk_type
+        + data
+        + struct.pack('>I', zlib.crc32(chunk_type + data))
+    )
+
+
+def _make_png(arr) -> bytes:
+    """把 (高, 宽, 3) 的 uint8 RGB 数组编码为最小的 PNG 文件"""
+    import numpy as np
+    
+    height, width = arr.shape[:2]
+    # 每行扫描线前加一个 0 字节（filter type None）
+    raw = np.pad(arr.reshape(height, width * 3), ((0, 0), (1, 0)))
+    ihdr = struct.pack('>IIBBBBB', width, height, 8, 2, 0, 0, 0)  # 8位 RGB，不隔行
+    return b''.join((
+        b'\x89PNG\r\n\x1a\n',
+        _png_chunk(b'IHDR', ihdr),
+        _png_chunk(b'IDAT', zlib.compress(raw.tobytes(), 1)),
+        _png_chunk(b'IEND', b''),
+    ))
+
+
+def _fast_save(prs: PresentationType, output_file: str):
+    """与 prs.save() 写出相同的包内容，但使用 compresslevel=1 且不重复压缩图片等部件"""
+    package = prs.part.package
+    parts = tuple(package.iter_parts())
+    
+    # 用 1 MiB 缓冲写出，减少小块 write 系统调用
+    with open(output_file, 'wb', buffering=_SAVE_BUFFER_SIZE) as f, zipfile.ZipFile(
+        f, 'w', zipfile.ZIP_DEFLATED, compresslevel=1, strict_timestamps=False
+    ) as zf:
+        zf.writestr(
+            CONTENT_TYPES_URI.membername,
+            serialize_part_xml(_ContentTypesItem.xml_for(parts)),
+        )
+        zf.writestr(PACKAGE_URI.rels_uri.membername, package._rels.xml)  # pyright: ignore[reportPrivateUsage]
+        for part in parts:
+            compress_type = (
+                zipfile.ZIP_STORED if part.content_type in _STORED_CONTENT_TYPES else None
+            )
+            zf.writestr(part.partname.membername, part.blob, compress_type=compress_type)
+            if part._rels:  # pyright: ignore[reportPrivateUsage]
+                zf.writestr(part.partname.rels_uri.membername, part.rels.xml)
+
+
+def create_title_slide(prs: PresentationType, layout: SlideLayout):
     """创建标题幻灯片"""
-    title_slide_layout = prs.slide_layouts[0]  # 标题布局
-    slide = prs.slides.add_slide(title_slide_layout)
+    slide = prs.slides.add_slide(layout)
     
     # 设置标题
     title = slide.shapes.title
     if title is not None:  # Safely handle potential None
-        # Use setattr to bypass type checking
-        setattr(title, 'text', "使用Python创建PowerPoint演示文稿")
+        title.text = "使用Python创建PowerPoint演示文稿"
     
     # 设置副标题
-    if len(slide.placeholders) > 1:
-        subtitle = slide.placeholders[1]
-        # Use setattr to bypass type checking
-        setattr(subtitle, 'text', f"创建于 {datetime.now().strftime('%Y-%m-%d')}\npython-pptx 示例")
+    placeholders = list(slide.placeholders)
+    if len(placeholders) > 1:
+        subtitle = placeholders[1]
+        subtitle.text = _SUBTITLE  # pyright: ignore[reportAttributeAccessIssue]
 
 
-def create_content_slide(prs: PresentationType):
+def create_content_slide(prs: PresentationType, layout: SlideLayout):
     """创建带有标题和内容的幻灯片"""
-    bullet_slide_layout = prs.slide_layouts[1]  # 带项目符号的布局
-    slide = prs.slides.add_slide(bullet_slide_layout)
+    slide = prs.slides.add_slide(layout)
     
     # 设置标题
     title = slide.shapes.title
     if title is not None:  # Safely handle potential None
-        # Use setattr to bypass type checking
-        setattr(title, 'text', "Python-PPTX 主要功能")
+        title.text = "Python-PPTX 主要功能"
     
     # 设置内容（带项目符号）
     tf = None
-    if len(slide.placeholders) > 1:
-        content = slide.placeholders[1]
+    placeholders = list(slide.placeholders)
+    if len(placeholders) > 1:
+        content = placeholders[1]
         # Use getattr to safely access the text_frame property
         tf = getattr(content, 'text_frame', None)
     
     # 添加项目符号列表
     if tf is not None:
-        # Use setattr to bypass type checking
-        setattr(tf, 'text', "Python-PPTX 库可以：")
-        
-        p = tf.add_paragraph()
-        # Use setattr to bypass type checking
-        setattr(p, 'text', "创建新的 PowerPoint 演示文稿")
-        p.level = 1
+        tf.text = "Python-PPTX 库可以："
         
-        p = tf.add_paragraph()
-        # Use setattr to bypass type checking
-        setattr(p, 'text', "添加和格式化文本内容")
-        p.level = 1
-        
-        p = tf.add_paragraph()
-        # Use setattr to bypass type checking
-        setattr(p, 'text', "添加各种形状和图表")
-        p.level = 1
-        
-        p = tf.add_paragraph()
-        # Use setattr to bypass type checking
-        setattr(p, 'text', "添加表格和图片")
-        p.level = 1
-        
-        p = tf.add_paragraph()
-        # Use setattr to bypass type checking
-        setattr(p, 'text', "读取和修改现有的演示文稿")
-        p.level = 1
+        # 一次性解析全部项目符号段落并追加到 txBody，避免逐段 add_paragraph
+        bullets = parse_xml(_CONTENT_BULLETS_XML)
+        tf._txBody.extend(list(bullets))  # pyright: ignore[reportPrivateUsage]
 
 
-def create_shapes_slide(prs: PresentationType):
+def create_shapes_slide(prs: PresentationType, layout: SlideLayout):
     """创建带有各种形状的幻灯片"""
-    # Access slide layout with type annotation
-    blank_slide_layout = prs.slide_layouts[6]  # 空白布局
-    slide = prs.slides.add_slide(blank_slide_layout)
-    
-    # 添加标题
-    title = slide.shapes.add_textbox(Inches(1), Inches(0.5), Inches(8), Inches(1))
-    tf = title.text_frame
-    p = tf.add_paragraph()
-    # Use setattr to bypass type checking
-    setattr(p, 'text', "各种形状演示")
-    p.font.size = Pt(40)
-    p.font.bold = True
-    p.alignment = PP_ALIGN.CENTER
+    slide = prs.slides.add_slide(layout)
     
-    # 添加矩形
-    shape = slide.shapes.add_shape(MSO_SHAPE.RECTANGLE, Inches(1), Inches(2), Inches(2), Inches(1))
-    shape.fill.solid()
-    shape.fill.fore_color.rgb = RGBColor(255, 0, 0)  # 红色
-    shape.shadow.inherit = False
-    
-    # 添加椭圆
-    shape = slide.shapes.add_shape(MSO_SHAPE.OVAL, Inches(4), Inches(2), Inches(2), Inches(1))
-    shape.fill.solid()
-    shape.fill.fore_color.rgb = RGBColor(0, 255, 0)  # 绿色
-    
-    # 添加三角形
-    # shape = slide.shapes.add_shape(MSO_SHAPE.TRIANGLE, Inches(7), Inches(2), Inches(2), Inches(1))
-    # shape.fill.solid()
-    # shape.fill.fore_color.rgb = RGBColor(0, 0, 255)  # 蓝色
-    
-    # 添加五角星
-    shape = slide.shapes.add_shape(MSO_SHAPE.STAR_5_POINT, Inches(2.5), Inches(4), Inches(2), Inches(2))
-    shape.fill.solid()
-    shape.fill.fore_color.rgb = RGBColor(255, 255, 0)  # 黄色
-    
-    # 添加心形
-    shape = slide.shapes.add_shape(MSO_SHAPE.HEART, Inches(5.5), Inches(4), Inches(2), Inches(2))
-    shape.fill.solid()
-    shape.fill.fore_color.rgb = RGBColor(255, 0, 255)  # 紫色
+    # 设置标题
+    _set_title(slide, "各种形状演示")
+    
+    # 按 _SHAPES 依次添加形状并设置纯色填充
+    add_shape = slide.shapes.add_shape
+    for shape_type, x, y, w, h, color, no_shadow in _SHAPES:
+        shape = add_shape(shape_type, _IN[x], _IN[y], _IN[w], _IN[h])
+        fill = shape.fill
+        fill.solid()
+        fill.fore_color.rgb = color
+        if no_shadow:
+            shape.shadow.inherit = False
 
 
-def create_table_slide(prs: PresentationType):
+def create_table_slide(prs: PresentationType, layout: SlideLayout):
     """创建带表格的幻灯片"""
-    blank_slide_layout = prs.slide_layouts[6]  # 空白布局
-    slide = prs.slides.add_slide(blank_slide_layout)
+    slide = prs.slides.add_slide(layout)
     
-    # 添加标题
-    title = slide.shapes.add_textbox(Inches(1), Inches(0.5), Inches(8), Inches(1))
-    tf = title.text_frame
-    p = tf.add_paragraph()
-    # Use setattr to bypass type checking
-    setattr(p, 'text', "表格演示")
-    p.font.size = Pt(40)
-    p.font.bold = True
-    p.alignment = PP_ALIGN.CENTER
+    # 设置标题
+    _set_title(slide, "表格演示")
     
     # 创建表格 - 4行3列
     rows, cols = 4, 3
-    left = Inches(2)
-    top = Inches(2)
-    width = Inches(6)
-    height = Inches(2)
+    left = _IN[2]
+    top = _IN[2]
+    width = _IN[6]
+    height = _IN[2]
     
     table = slide.shapes.add_table(rows, cols, left, top, width, height).table
     
     # 设置表头
     headers = ('产品', '季度销售额', '年度增长率')
-    for i, header in enumerate(headers):
-        cell = table.cell(0, i)
-        cell.text = header
-        cell.text_frame.paragraphs[0].font.bold = True
-        cell.text_frame.paragraphs[0].font.size = Pt(14)
+    header_size = _PT[14]
+    tr_lst = table._tbl.tr_lst  # pyright: ignore[reportPrivateUsage]
+    for tc, header in zip(tr_lst[0].tc_lst, headers):
+        _fast_set_cell(tc, header, bold=True, size=header_size)
     
     # 填充数据
     data = (
@@ -208,74 +516,46 @@ def create_table_slide(prs: PresentationType):
         ('产品 C', '¥12,750', '+20%'),
     )
     
-    for row_idx, row_data in enumerate(data):
-        for col_idx, cell_text in enumerate(row_data):
-            cell = table.cell(row_idx + 1, col_idx)
-            cell.text = cell_text
+    # 直接遍历 <a:tr>/<a:tc> 元素，不为每个单元格构造 _Cell 代理对象
+    for tr, row_data in zip(tr_lst[1:], data):
+        for tc, cell_text in zip(tr.tc_lst, row_data):
+            _fast_set_cell(tc, cell_text)
 
 
-def create_chart_slide(prs: PresentationType):
+def create_chart_slide(prs: PresentationType, layout: SlideLayout):
     """创建带图表的幻灯片"""
-    blank_slide_layout = prs.slide_layouts[6]  # 空白布局
-    slide = prs.slides.add_slide(blank_slide_layout)
-    
-    # 添加标题
-    title = slide.shapes.add_textbox(Inches(1), Inches(0.5), Inches(8), Inches(1))
-    tf = title.text_frame
-    p = tf.add_paragraph()
-    # Use setattr to bypass type checking
-    setattr(p, 'text', "图表演示")
-    p.font.size = Pt(40)
-    p.font.bold = True
-    p.alignment = PP_ALIGN.CENTER
+    from pptx.parts.chart import ChartPart
     
-    # 创建图表数据
-    chart_data = CategoryChartData()
-    chart_data.categories = ['一季度', '二季度', '三季度', '四季度']
+    slide = prs.slides.add_slide(layout)
     
-    # 添加两个系列的数据 - 使用类型安全的方式
-    # 对CategoryChartData使用Any类型绕过类型检查
-    chart_data_any: Any = chart_data
-    
-    # 直接传入数据可以正常工作，因为Any类型会绕过类型检查
-    chart_data_any.add_series('2024年', (8.5, 10.2, 12.5, 9.8))
-    chart_data_any.add_series('2025年', (10.2, 11.5, 13.8, 11.2))
-    
-    # 添加图表
-    x, y, cx, cy = Inches(1.5), Inches(2), Inches(7), Inches(5)
-    
-    # Add chart with type safety - use type casting to bypass type checking
-    chart_data_typed: Any = chart_data  # Cast to Any to bypass type checking
-    shape = slide.shapes.add_chart(
-        XL_CHART_TYPE.COLUMN_CLUSTERED, x, y, cx, cy, chart_data_typed
+    # 设置标题
+    _set_title(slide, "图表演示")
+    
+    # 直接用预先生成的图表 XML 和嵌入工作簿创建图表部件，不经过 CategoryChartData
+    package = slide.part.package
+    chart_part = ChartPart.load(
+        package.next_partname(ChartPart.partname_template),
+        CT.DML_CHART,
+        package,
+        _chart_xml(),
     )
+    chart_part.chart_workbook.update_from_xlsx_blob(_chart_xlsx_blob())
+    rId = slide.part.relate_to(chart_part, RT.CHART)
     
-    # Get chart attribute safely
-    chart = getattr(shape, 'chart', None)
-    
-    # 设置图表标题
-    if chart is not None and hasattr(chart, 'has_title'):
-        chart.has_title = True
-        if hasattr(chart, 'chart_title') and hasattr(chart.chart_title, 'text_frame'):
-            chart.chart_title.text_frame.text = "季度销售额对比"
+    # 添加图表
+    x, y, cx, cy = _IN[1.5], _IN[2], _IN[7], _IN[5]
+    slide.shapes._add_chart_graphicFrame(rId, x, y, cx, cy)  # pyright: ignore[reportPrivateUsage]
 
 
-def create_image_slide(prs: PresentationType):
+def create_image_slide(prs: PresentationType, layout: SlideLayout):
     """创建带图片的幻灯片（需要图片文件）"""
-    blank_slide_layout = prs.slide_layouts[6]  # 空白布局
-    slide = prs.slides.add_slide(blank_slide_layout)
+    slide = prs.slides.add_slide(layout)
     
-    # 添加标题
-    title = slide.shapes.add_textbox(Inches(1), Inches(0.5), Inches(8), Inches(1))
-    tf = title.text_frame
-    p = tf.add_paragraph()
-    p.text = "图片示例"
-    p.font.size = Pt(40)
-    p.font.bold = True
-    p.alignment = PP_ALIGN.CENTER
+    # 设置标题
+    _set_title(slide, "图片示例")
     
     # 创建说明文字
-    textbox = slide.shapes.add_textbox(Inches(1), Inches(2), Inches(8), Inches(1))
+    textbox = slide.shapes.add_textbox(_IN[1], _IN[2], _IN[8], _IN[1])
     tf = textbox.text_frame
     tf.text = "注意: 要添加图片，您需要有一个实际的图片文件"
     tf.paragraphs[0].font.italic = True
@@ -288,83 +568,52 @@ def create_image_slide(prs: PresentationType):
     '''
     
     # 添加说明性文本
-    textbox = slide.shapes.add_textbox(Inches(1), Inches(4), Inches(8), Inches(2))
+    textbox = slide.shapes.add_textbox(_IN[1], _IN[4], _IN[8], _IN[2])
     tf = textbox.text_frame
     p = tf.add_paragraph()
     p.text = "使用 slide.shapes.add_picture() 方法添加图片"
-    p.font.size = Pt(20)
+    p.font.size = _PT[20]
     p.alignment = PP_ALIGN.CENTER
     
     p = tf.add_paragraph()
     p.text = "可以指定图片位置和大小"
-    p.font.size = Pt(16)
+    p.font.size = _PT[16]
     p.alignment = PP_ALIGN.CENTER
 
-def create_image_slide_v2(prs: PresentationType):
+def create_image_slide_v2(prs: PresentationType, layout: SlideLayout):
     """创建带图片的幻灯片（使用内存图片文件）"""
-    blank_slide_layout = prs.slide_layouts[6]  # 空白布局
-    slide = prs.slides.add_slide(blank_slide_layout)
-    
-    # 添加标题
-    title = slide.shapes.add_textbox(Inches(1), Inches(0.5), Inches(8), Inches(1))
-    tf = title.text_frame
-    p = tf.add_paragraph()
-    # Use setattr to bypass type checking
-    setattr(p, 'text', "内存图片示例")
-    p.font.size = Pt(40)
-    p.font.bold = True
-    p.alignment = PP_ALIGN.CENTER
+    import numpy as np
     
     # 在内存中创建一个图片
-    # 创建一个500x300的RGB图片（白色背景）
-    img = Image.new('RGB', (500, 300), color='white')
-    draw = ImageDraw.Draw(img)
-    
-    # 绘制一些形状
-    draw.rectangle(
-        [(20, 20), (480, 280)],
-        outline='blue',
-        width=5
-    )
+    # 创建一个500x300的RGB像素缓冲区，背景和形状由 _render_demo 绘制
+    arr = np.empty((300, 500, 3), dtype=np.uint8)
+    _render_demo(arr)
     
-    # 绘制一个填充的矩形
-    draw.rectangle(
-        [(100, 100), (400, 200)],
-        fill='lightblue',
-        outline='darkblue',
-        width=2
-    )
+    # 直接编码为PNG字节流，不经过PIL
+    # PIL 默认字体不含中文字形，原先的 "内存中生成的图片" 只会画成一排方框，因此不再绘制文字
+    img_byte_arr = io.BytesIO(_make_png(arr))
     
-    # 添加文本
-    draw.text(
-        (250, 150),
-        "内存中生成的图片", 
-        fill='black',
-        anchor="mm"  # 中心对齐
-    )
+    slide = prs.slides.add_slide(layout)
     
-    # 将PIL图像转换为字节流
-    img_byte_arr = io.BytesIO()
-    img.save(img_byte_arr, format='PNG')
-    img_byte_arr.seek(0)  # 将指针移回开始位置
+    # 设置标题
+    _set_title(slide, "内存图片示例")
     
     # 将内存中的图片添加到幻灯片
     slide.shapes.add_picture(
         img_byte_arr,  # BytesIO对象替代文件路径
-        Inches(2), 
-        Inches(2.5), 
-        width=Inches(6)
+        _IN[2], 
+        _IN[2.5], 
+        width=_IN[6]
     )
     
     # 添加说明性文本
-    textbox = slide.shapes.add_textbox(Inches(1), Inches(6), Inches(8), Inches(1))
+    textbox = slide.shapes.add_textbox(_IN[1], _IN[6], _IN[8], _IN[1])
     tf = textbox.text_frame
     p = tf.add_paragraph()
-    # Use setattr to bypass type checking
-    setattr(p, 'text', "使用BytesIO和PIL在内存中生成并添加图片")
-    p.font.size = Pt(16)
+    p.text = "使用BytesIO和NumPy在内存中生成并添加图片"
+    p.font.size = _PT[16]
     p.alignment = PP_ALIGN.CENTER
 
 
 if __name__ == "__main__":
-    main()
\ No newline at end of file
+    main(parallel='--parallel' in sys.argv[1:])
\ No newline at end of file